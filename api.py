@@ -1,33 +1,34 @@
-from flask import Blueprint, request, jsonify
-from flask_login import login_required, current_user
-from models import db, User, ChildProfile, Book, ReadingList, Challenge, Resource, LearningPath, PathActivity, ProgressAssessment
-from datetime import datetime
+from flask import Blueprint, request, jsonify, g
+from auth import auth_required, load_token_identity, get_current_user_id
+from flask_caching import Cache
+from models import db, User, ChildProfile, Book, ReadingList, Challenge, Resource, LearningPath, PathActivity, ProgressAssessment, challenge_participants, split_csv_values, ReadingStatus, ActivityStatus, enum_values
+from sqlalchemy import select, tuple_, func, case
+from sqlalchemy.orm import selectinload, contains_eager, undefer, raiseload
+from datetime import datetime, timezone
 import json
 
 api_bp = Blueprint('api', __name__)
+api_bp.before_request(load_token_identity)
+cache = Cache()
 
 # Child Profile Routes
 @api_bp.route('/child-profiles', methods=['GET'])
-@login_required
+@auth_required
 def get_child_profiles():
-    profiles = ChildProfile.query.filter_by(user_id=current_user.id).all()
+    profiles = ChildProfile.query.options(raiseload('*')).filter_by(user_id=g.user_id).all()
     return jsonify({
         'profiles': [profile.to_dict() for profile in profiles]
     }), 200
 
 @api_bp.route('/child-profiles/<int:profile_id>', methods=['GET'])
-@login_required
+@auth_required
 def get_child_profile(profile_id):
-    profile = ChildProfile.query.get_or_404(profile_id)
-    
-    # Verify ownership
-    if profile.user_id != current_user.id:
-        return jsonify({'message': 'Unauthorized'}), 403
+    profile = get_owned_profile(profile_id)
     
     return jsonify(profile.to_dict()), 200
 
 @api_bp.route('/child-profiles', methods=['POST'])
-@login_required
+@auth_required
 def create_child_profile():
     data = request.get_json()
     
@@ -37,21 +38,26 @@ def create_child_profile():
         if field not in data:
             return jsonify({'message': f'Missing required field: {field}'}), 400
     
+    if 'interests' in data and not interests_are_valid(data['interests']):
+        return jsonify({'message': "Interests must be strings without '|'"}), 400
+    
     # Create new profile
     new_profile = ChildProfile(
-        user_id=current_user.id,
+        user_id=g.user_id,
         name=data['name'],
         age=data['age'],
         reading_level=data['reading_level'],
         avatar_url=data.get('avatar_url')
     )
     
+    # Save to database
+    db.session.add(new_profile)
+    db.session.flush()
+    
     # Add interests if provided
     if 'interests' in data and isinstance(data['interests'], list):
-        new_profile.interests = data['interests']
+        ChildProfile.bulk_add_interests(new_profile.id, data['interests'])
     
-    # Save to database
-    db.session.add(new_profile)
     db.session.commit()
     
     # Generate initial learning path
@@ -63,16 +69,15 @@ def create_child_profile():
     }), 201
 
 @api_bp.route('/child-profiles/<int:profile_id>', methods=['PUT'])
-@login_required
+@auth_required
 def update_child_profile(profile_id):
-    profile = ChildProfile.query.get_or_404(profile_id)
-    
-    # Verify ownership
-    if profile.user_id != current_user.id:
-        return jsonify({'message': 'Unauthorized'}), 403
+    profile = get_owned_profile(profile_id)
     
     data = request.get_json()
     
+    if 'interests' in data and not interests_are_valid(data['interests']):
+        return jsonify({'message': "Interests must be strings without '|'"}), 400
+    
     # Update fields
     if 'name' in data:
         profile.name = data['name']
@@ -83,7 +88,8 @@ def update_child_profile(profile_id):
     if 'avatar_url' in data:
         profile.avatar_url = data['avatar_url']
     if 'interests' in data and isinstance(data['interests'], list):
-        profile.interests = data['interests']
+        # Drop repeats, as the insert on create does, so no interest row is added twice
+        profile.interests = list(dict.fromkeys(data['interests']))
     
     # Save changes
     db.session.commit()
@@ -94,13 +100,9 @@ def update_child_profile(profile_id):
     }), 200
 
 @api_bp.route('/child-profiles/<int:profile_id>', methods=['DELETE'])
-@login_required
+@auth_required
 def delete_child_profile(profile_id):
-    profile = ChildProfile.query.get_or_404(profile_id)
-    
-    # Verify ownership
-    if profile.user_id != current_user.id:
-        return jsonify({'message': 'Unauthorized'}), 403
+    profile = get_owned_profile(profile_id)
     
     # Delete the profile
     db.session.delete(profile)
@@ -118,70 +120,74 @@ def get_books():
     genre = request.args.get('genre')
     search_query = request.args.get('query')
     interactive_only = request.args.get('interactive', 'false').lower() == 'true'
-    limit = int(request.args.get('limit', 20))
-    
-    # Build query
-    query = Book.query
+    page, per_page = get_pagination_args(request.args.get('limit', 20, type=int))
+    before_rating = request.args.get('before_rating', type=float)
+    before_id = request.args.get('before_id', type=int)
+    
+    if not cursor_is_complete(before_rating, before_id, 'before_rating', 'before_id'):
+        return jsonify({'message': 'Invalid cursor'}), 400
+    
+    # Query the columns shown in book listings; details come from /books/<id>
+    query = Book.list_stmt(
+        age_range=age_range,
+        genre=genre,
+        interactive_only=interactive_only,
+        search_query=search_query,
+        before_rating=before_rating,
+        before_id=before_id,
+        limit=per_page,
+        offset=(page - 1) * per_page
+    )
+    books = [dict(row) for row in db.session.execute(query).mappings()]
+    for book in books:
+        book['tags'] = split_csv_values(book.pop('tags_csv'))
     
-    if age_range:
-        query = query.filter_by(age_range=age_range)
-    if genre:
-        query = query.filter_by(genre=genre)
-    if interactive_only:
-        query = query.filter_by(is_interactive=True)
-    if search_query:
-        query = query.filter(Book.title.ilike(f'%{search_query}%') | 
-                            Book.author.ilike(f'%{search_query}%') |
-                            Book.description.ilike(f'%{search_query}%'))
-    
-    # Execute query with limit
-    books = query.limit(limit).all()
+    next_cursor = None
+    if len(books) == per_page:
+        # The listing sorts unrated books as 0, so the cursor does too
+        last_rating = books[-1]['rating']
+        next_cursor = {'before_rating': last_rating if last_rating is not None else 0, 'before_id': books[-1]['id']}
     
     return jsonify({
-        'books': [book.to_dict() for book in books]
+        'books': books,
+        'page': page,
+        'per_page': per_page,
+        'next_cursor': next_cursor
     }), 200
 
 @api_bp.route('/books/featured', methods=['GET'])
 def get_featured_books():
-    # Get featured books (top rated or curated)
-    featured_books = Book.query.order_by(Book.rating.desc()).limit(4).all()
-    
     return jsonify({
-        'featured_books': [book.to_dict() for book in featured_books]
+        'featured_books': load_featured_books()
     }), 200
 
 @api_bp.route('/books/<int:book_id>', methods=['GET'])
 def get_book(book_id):
-    book = Book.query.get_or_404(book_id)
+    book = Book.query.options(undefer(Book.description), raiseload('*')).get_or_404(book_id)
     return jsonify(book.to_dict()), 200
 
 # Reading List Routes
 @api_bp.route('/reading-list/<int:profile_id>', methods=['GET'])
-@login_required
+@auth_required
 def get_reading_list(profile_id):
     # Verify profile belongs to user
-    profile = ChildProfile.query.get_or_404(profile_id)
-    if profile.user_id != current_user.id:
-        return jsonify({'message': 'Unauthorized'}), 403
+    get_owned_profile(profile_id)
     
-    # Get reading list items
-    reading_list = ReadingList.query.filter_by(child_profile_id=profile_id).all()
+    # Get reading list items with their books in a single query
+    reading_list = db.session.scalars(ReadingList.list_for_child_stmt(profile_id)).all()
     
-    # Get book details for each item
     result = []
     for item in reading_list:
-        book = Book.query.get(item.book_id)
-        if book:
-            item_dict = item.to_dict()
-            item_dict['book'] = book.to_dict()
-            result.append(item_dict)
+        item_dict = item.to_dict()
+        item_dict['book'] = item.book.to_dict()
+        result.append(item_dict)
     
     return jsonify({
         'reading_list': result
     }), 200
 
 @api_bp.route('/reading-list', methods=['POST'])
-@login_required
+@auth_required
 def add_to_reading_list():
     data = request.get_json()
     
@@ -190,18 +196,20 @@ def add_to_reading_list():
         return jsonify({'message': 'Missing required fields'}), 400
     
     # Verify profile belongs to user
-    profile = ChildProfile.query.get_or_404(data['child_profile_id'])
-    if profile.user_id != current_user.id:
-        return jsonify({'message': 'Unauthorized'}), 403
+    get_owned_profile(data['child_profile_id'])
     
     # Verify book exists
-    book = Book.query.get_or_404(data['book_id'])
+    book = Book.query.options(undefer(Book.description)).get_or_404(data['book_id'])
+    
+    status = data.get('status', ReadingStatus.TO_READ)
+    if status not in enum_values(ReadingStatus):
+        return jsonify({'message': 'Invalid status'}), 400
     
     # Check if book is already in reading list
-    existing = ReadingList.query.filter_by(
+    existing = db.session.query(ReadingList.query.filter_by(
         child_profile_id=data['child_profile_id'],
         book_id=data['book_id']
-    ).first()
+    ).exists()).scalar()
     
     if existing:
         return jsonify({'message': 'Book already in reading list'}), 400
@@ -210,15 +218,18 @@ def add_to_reading_list():
     new_item = ReadingList(
         child_profile_id=data['child_profile_id'],
         book_id=data['book_id'],
-        status=data.get('status', 'to-read')
+        status=status
     )
     
+    # Serialize the book before the commit expires it; it is not changed here
+    book_dict = book.to_dict()
+    
     db.session.add(new_item)
     db.session.commit()
     
     # Get book details
     item_dict = new_item.to_dict()
-    item_dict['book'] = book.to_dict()
+    item_dict['book'] = book_dict
     
     return jsonify({
         'message': 'Book added to reading list',
@@ -226,23 +237,22 @@ def add_to_reading_list():
     }), 201
 
 @api_bp.route('/reading-list/<int:item_id>', methods=['PUT'])
-@login_required
+@auth_required
 def update_reading_list(item_id):
-    item = ReadingList.query.get_or_404(item_id)
-    
-    # Verify ownership
-    profile = ChildProfile.query.get(item.child_profile_id)
-    if profile.user_id != current_user.id:
-        return jsonify({'message': 'Unauthorized'}), 403
+    # Fetch the item only if it belongs to one of the user's profiles
+    item = ReadingList.query.join(ChildProfile).filter(
+        ReadingList.id == item_id,
+        ChildProfile.user_id == g.user_id
+    ).first_or_404()
     
     data = request.get_json()
     
     # Update status
-    if 'status' in data and data['status'] in ['to-read', 'in-progress', 'completed']:
+    if 'status' in data and data['status'] in enum_values(ReadingStatus):
         item.status = data['status']
         
         # If status changed to completed, update completed_at
-        if data['status'] == 'completed':
+        if data['status'] == ReadingStatus.COMPLETED:
             item.completed_at = datetime.utcnow()
     
     # Update progress
@@ -254,24 +264,76 @@ def update_reading_list(item_id):
     db.session.commit()
     
     # Get book details
-    book = Book.query.get(item.book_id)
     item_dict = item.to_dict()
-    item_dict['book'] = book.to_dict()
+    item_dict['book'] = item.book.to_dict()
     
     return jsonify({
         'message': 'Reading list item updated',
         'reading_list_item': item_dict
     }), 200
 
+@api_bp.route('/reading-list/<int:profile_id>/progress', methods=['PUT'])
+@auth_required
+def update_reading_progress(profile_id):
+    # Verify profile belongs to user
+    get_owned_profile(profile_id)
+    
+    data = request.get_json(silent=True)
+    items = data.get('items') if isinstance(data, dict) else None
+    if not isinstance(items, list) or not items:
+        return jsonify({'message': 'Missing required field: items'}), 400
+    
+    # Build one row per book; a later entry for the same book wins
+    now = datetime.utcnow()
+    rows = {}
+    for entry in items:
+        try:
+            book_id = int(entry['book_id'])
+            progress = int(entry['progress_percentage'])
+        except (KeyError, TypeError, ValueError):
+            return jsonify({'message': 'Each item needs a book_id and progress_percentage'}), 400
+        if not 0 <= progress <= 100:
+            return jsonify({'message': 'progress_percentage must be between 0 and 100'}), 400
+        
+        if progress == 100:
+            status = ReadingStatus.COMPLETED
+        elif progress > 0:
+            status = ReadingStatus.IN_PROGRESS
+        else:
+            status = ReadingStatus.TO_READ
+        status = entry.get('status', status)
+        if not isinstance(status, str) or status not in enum_values(ReadingStatus):
+            return jsonify({'message': 'Invalid status'}), 400
+        
+        rows[book_id] = {
+            'book_id': book_id,
+            'progress_percentage': progress,
+            'status': status,
+            'completed_at': now if status == ReadingStatus.COMPLETED else None
+        }
+    
+    # Verify all books exist
+    found = db.session.execute(select(func.count()).where(Book.id.in_(rows))).scalar()
+    if found != len(rows):
+        return jsonify({'message': 'Book not found'}), 404
+    
+    # Insert or update every item with a single statement
+    reading_list = [dict(row) for row in ReadingList.upsert_progress(profile_id, rows.values())]
+    db.session.commit()
+    
+    return jsonify({
+        'message': 'Reading progress updated',
+        'reading_list': reading_list
+    }), 200
+
 @api_bp.route('/reading-list/<int:item_id>', methods=['DELETE'])
-@login_required
+@auth_required
 def remove_from_reading_list(item_id):
-    item = ReadingList.query.get_or_404(item_id)
-    
-    # Verify ownership
-    profile = ChildProfile.query.get(item.child_profile_id)
-    if profile.user_id != current_user.id:
-        return jsonify({'message': 'Unauthorized'}), 403
+    # Fetch the item only if it belongs to one of the user's profiles
+    item = ReadingList.query.join(ChildProfile).filter(
+        ReadingList.id == item_id,
+        ChildProfile.user_id == g.user_id
+    ).first_or_404()
     
     db.session.delete(item)
     db.session.commit()
@@ -283,60 +345,49 @@ def remove_from_reading_list(item_id):
 # Challenge Routes
 @api_bp.route('/challenges', methods=['GET'])
 def get_challenges():
-    challenges = Challenge.query.all()
+    page, per_page = get_pagination_args()
+    challenges = Challenge.query.options(
+        undefer(Challenge.participants_count), raiseload('*')
+    ).order_by(Challenge.id).limit(per_page).offset((page - 1) * per_page).all()
     return jsonify({
-        'challenges': [challenge.to_dict() for challenge in challenges]
+        'challenges': [challenge.to_dict() for challenge in challenges],
+        'page': page,
+        'per_page': per_page
     }), 200
 
 @api_bp.route('/challenges/active', methods=['GET'])
 def get_active_challenges():
-    active_challenges = Challenge.query.filter_by(is_active=True).all()
+    active_challenge = load_active_challenge()
     
     # If no active challenges found, return null or empty list
-    if not active_challenges:
+    if active_challenge is None:
         return jsonify(None), 200
     
-    # For demonstration, return the first active challenge
-    active_challenge = active_challenges[0]
-    
-    # Add progress info if user is logged in
-    if current_user.is_authenticated:
-        profiles = ChildProfile.query.filter_by(user_id=current_user.id).all()
-        if profiles:
-            child_profile_id = profiles[0].id
-            
-            # Find participant info
-            participant = db.session.query(challenge_participants).filter_by(
-                challenge_id=active_challenge.id,
-                child_profile_id=child_profile_id
-            ).first()
-            
-            if participant:
-                challenge_dict = active_challenge.to_dict()
-                challenge_dict['progress'] = participant.progress
-                challenge_dict['total'] = active_challenge.goal
-                
-                # Calculate days remaining
-                now = datetime.utcnow()
-                days_remaining = (active_challenge.end_date - now).days
-                challenge_dict['days_remaining'] = max(0, days_remaining)
-                
-                return jsonify(challenge_dict), 200
-    
-    # If user not logged in or no profiles, return challenge with dummy progress
-    challenge_dict = active_challenge.to_dict()
-    challenge_dict['progress'] = 0
-    challenge_dict['total'] = active_challenge.goal
+    # Find participant info for the user's profiles if logged in
+    participant = None
+    user_id = get_current_user_id()
+    if user_id is not None:
+        participant = db.session.query(challenge_participants.c.progress).join(
+            ChildProfile, ChildProfile.id == challenge_participants.c.child_profile_id
+        ).filter(
+            challenge_participants.c.challenge_id == active_challenge['id'],
+            ChildProfile.user_id == user_id
+        ).order_by(ChildProfile.id).first()
+    
+    # Anonymous users and non-participants see zero progress
+    challenge_dict = dict(active_challenge)
+    challenge_dict['progress'] = participant.progress if participant else 0
+    challenge_dict['total'] = active_challenge['goal']
     
     # Calculate days remaining
     now = datetime.utcnow()
-    days_remaining = (active_challenge.end_date - now).days
+    days_remaining = (active_challenge['end_date'] - now).days
     challenge_dict['days_remaining'] = max(0, days_remaining)
     
     return jsonify(challenge_dict), 200
 
 @api_bp.route('/challenges/<int:challenge_id>/join', methods=['POST'])
-@login_required
+@auth_required
 def join_challenge(challenge_id):
     data = request.get_json()
     
@@ -345,9 +396,7 @@ def join_challenge(challenge_id):
         return jsonify({'message': 'Child profile ID is required'}), 400
     
     # Verify profile belongs to user
-    profile = ChildProfile.query.get_or_404(data['child_profile_id'])
-    if profile.user_id != current_user.id:
-        return jsonify({'message': 'Unauthorized'}), 403
+    get_owned_profile(data['child_profile_id'])
     
     # Verify challenge exists and is active
     challenge = Challenge.query.get_or_404(challenge_id)
@@ -355,33 +404,29 @@ def join_challenge(challenge_id):
         return jsonify({'message': 'This challenge is not currently active'}), 400
     
     # Check if already joined
-    existing = db.session.query(challenge_participants).filter_by(
+    existing = db.session.query(db.session.query(challenge_participants).filter_by(
         challenge_id=challenge_id,
         child_profile_id=data['child_profile_id']
-    ).first()
+    ).exists()).scalar()
     
     if existing:
         return jsonify({'message': 'Already joined this challenge'}), 400
     
     # Join the challenge
-    new_participant = challenge_participants.insert().values(
-        challenge_id=challenge_id,
-        child_profile_id=data['child_profile_id'],
-        progress=0,
-        completed=False,
-        joined_at=datetime.utcnow()
-    )
-    
-    db.session.execute(new_participant)
+    Challenge.bulk_add_participants(challenge_id, [data['child_profile_id']])
     db.session.commit()
     
+    # Participant counts are part of the cached active challenge; with the default per-process
+    # SimpleCache this only clears this worker's copy and the others catch up within the timeout
+    cache.delete('active_challenge')
+    
     return jsonify({
         'message': 'Successfully joined the challenge',
         'challenge': challenge.to_dict()
     }), 201
 
 @api_bp.route('/challenges/progress/<int:challenge_id>', methods=['PUT'])
-@login_required
+@auth_required
 def update_challenge_progress(challenge_id):
     data = request.get_json()
     
@@ -390,35 +435,30 @@ def update_challenge_progress(challenge_id):
         return jsonify({'message': 'Missing required fields'}), 400
     
     # Verify profile belongs to user
-    profile = ChildProfile.query.get_or_404(data['child_profile_id'])
-    if profile.user_id != current_user.id:
-        return jsonify({'message': 'Unauthorized'}), 403
+    get_owned_profile(data['child_profile_id'])
     
     # Verify challenge exists
     challenge = Challenge.query.get_or_404(challenge_id)
     
-    # Update progress
-    participant = db.session.query(challenge_participants).filter_by(
-        challenge_id=challenge_id,
-        child_profile_id=data['child_profile_id']
-    ).first()
-    
-    if not participant:
-        return jsonify({'message': 'Not participating in this challenge'}), 404
-    
-    # Update progress
     progress = int(data['progress'])
     
     # Check if challenge is completed
     completed = progress >= challenge.goal
     
-    db.session.query(challenge_participants).filter_by(
-        challenge_id=challenge_id,
-        child_profile_id=data['child_profile_id']
-    ).update({
-        'progress': progress,
-        'completed': completed
-    })
+    # Update progress; no returned row means the child never joined
+    participant = db.session.execute(
+        challenge_participants.update().where(
+            (challenge_participants.c.challenge_id == challenge_id) &
+            (challenge_participants.c.child_profile_id == data['child_profile_id'])
+        ).values(
+            progress=progress,
+            completed=completed
+        ).returning(challenge_participants.c.progress, challenge_participants.c.completed)
+    ).fetchone()
+    
+    if participant is None:
+        db.session.rollback()
+        return jsonify({'message': 'Not participating in this challenge'}), 404
     
     db.session.commit()
     
@@ -435,46 +475,54 @@ def get_resources():
     resource_type = request.args.get('type')
     category = request.args.get('category')
     age_range = request.args.get('age_range')
+    page, per_page = get_pagination_args()
     
-    # Build query
-    query = Resource.query
+    # Build query over plain rows; the listing needs no ORM instances and leaves the
+    # description to the detail endpoint
+    query = select(
+        Resource.id, Resource.title, Resource.type, Resource.category, Resource.age_range,
+        Resource.file_url, Resource.thumbnail_url, Resource.created_at
+    )
     
     if resource_type:
-        query = query.filter_by(type=resource_type)
+        query = query.where(Resource.type == resource_type)
     if category:
-        query = query.filter_by(category=category)
+        query = query.where(Resource.category == category)
     if age_range:
-        query = query.filter_by(age_range=age_range)
+        query = query.where(Resource.age_range == age_range)
     
-    resources = query.all()
+    query = query.order_by(Resource.id).limit(per_page).offset((page - 1) * per_page)
+    resources = [dict(row) for row in db.session.execute(query).mappings()]
     
     return jsonify({
-        'resources': [resource.to_dict() for resource in resources]
+        'resources': resources,
+        'page': page,
+        'per_page': per_page
     }), 200
 
 @api_bp.route('/resources/<int:resource_id>', methods=['GET'])
 def get_resource(resource_id):
-    resource = Resource.query.get_or_404(resource_id)
+    resource = Resource.query.options(undefer(Resource.description)).get_or_404(resource_id)
     return jsonify(resource.to_dict()), 200
 
 # Learning Path Routes
 @api_bp.route('/learning-paths/<int:profile_id>', methods=['GET'])
-@login_required
+@auth_required
 def get_learning_paths(profile_id):
     # Verify profile belongs to user
-    profile = ChildProfile.query.get_or_404(profile_id)
-    if profile.user_id != current_user.id:
-        return jsonify({'message': 'Unauthorized'}), 403
+    get_owned_profile(profile_id)
     
-    # Get learning paths
-    paths = LearningPath.query.filter_by(child_profile_id=profile_id).all()
+    # Get learning paths along with their activities in one extra query
+    paths = LearningPath.query.options(
+        undefer(LearningPath.description),
+        selectinload(LearningPath.path_activities).undefer(PathActivity.description),
+        raiseload('*')
+    ).filter_by(child_profile_id=profile_id).all()
     
-    # Get activities for each path
     result = []
     for path in paths:
         path_dict = path.to_dict()
-        activities = PathActivity.query.filter_by(learning_path_id=path.id).order_by(PathActivity.stage_number).all()
-        path_dict['activities'] = [activity.to_dict() for activity in activities]
+        path_dict['activities'] = [activity.to_dict() for activity in path.path_activities]
         result.append(path_dict)
     
     return jsonify({
@@ -482,26 +530,26 @@ def get_learning_paths(profile_id):
     }), 200
 
 @api_bp.route('/learning-paths/activities/<int:activity_id>', methods=['PUT'])
-@login_required
+@auth_required
 def update_path_activity(activity_id):
-    activity = PathActivity.query.get_or_404(activity_id)
-    
-    # Get path to verify ownership
-    path = LearningPath.query.get(activity.learning_path_id)
-    
-    # Verify profile belongs to user
-    profile = ChildProfile.query.get(path.child_profile_id)
-    if profile.user_id != current_user.id:
-        return jsonify({'message': 'Unauthorized'}), 403
+    # Fetch the activity, its path and profile only if they belong to the user
+    activity = PathActivity.query.join(LearningPath).join(ChildProfile).filter(
+        PathActivity.id == activity_id,
+        ChildProfile.user_id == g.user_id
+    ).options(
+        contains_eager(PathActivity.learning_path).contains_eager(LearningPath.child_profile),
+        undefer(PathActivity.description)
+    ).first_or_404()
+    path = activity.learning_path
     
     data = request.get_json()
     
     # Update status
-    if 'status' in data and data['status'] in ['pending', 'in-progress', 'completed']:
+    if 'status' in data and data['status'] in enum_values(ActivityStatus):
         activity.status = data['status']
         
         # If completed, update is_completed flag
-        if data['status'] == 'completed':
+        if data['status'] == ActivityStatus.COMPLETED:
             activity.is_completed = True
             
             # Check if this is the current stage in the path
@@ -511,14 +559,10 @@ def update_path_activity(activity_id):
                     path.current_stage += 1
                     
                 # Update path progress percentage
-                completed_activities = PathActivity.query.filter_by(
-                    learning_path_id=path.id,
-                    is_completed=True
-                ).count()
-                
-                total_activities = PathActivity.query.filter_by(
-                    learning_path_id=path.id
-                ).count()
+                completed_activities, total_activities = db.session.query(
+                    func.coalesce(func.sum(case((PathActivity.is_completed, 1), else_=0)), 0),
+                    func.count(PathActivity.id)
+                ).filter(PathActivity.learning_path_id == path.id).one()
                 
                 if total_activities > 0:
                     path.progress_percentage = int((completed_activities / total_activities) * 100)
@@ -533,24 +577,64 @@ def update_path_activity(activity_id):
 
 # Progress Assessment Routes
 @api_bp.route('/assessments/<int:profile_id>', methods=['GET'])
-@login_required
+@auth_required
 def get_assessments(profile_id):
     # Verify profile belongs to user
-    profile = ChildProfile.query.get_or_404(profile_id)
-    if profile.user_id != current_user.id:
-        return jsonify({'message': 'Unauthorized'}), 403
+    get_owned_profile(profile_id)
+    
+    page, per_page = get_pagination_args()
+    before = request.args.get('before')
+    before_id = request.args.get('before_id', type=int)
+    
+    if not cursor_is_complete(before, before_id, 'before', 'before_id'):
+        return jsonify({'message': 'Invalid cursor'}), 400
+    
+    # Notes have no detail endpoint, so the history is the only place they are returned
+    query = select(
+        ProgressAssessment.id, ProgressAssessment.child_profile_id, ProgressAssessment.assessment_date,
+        ProgressAssessment.reading_level, ProgressAssessment.reading_fluency_score,
+        ProgressAssessment.comprehension_score, ProgressAssessment.vocabulary_score,
+        ProgressAssessment.notes
+    ).where(
+        ProgressAssessment.child_profile_id == profile_id
+    ).order_by(
+        ProgressAssessment.assessment_date.desc(),
+        ProgressAssessment.id.desc()
+    )
     
-    # Get assessments
-    assessments = ProgressAssessment.query.filter_by(child_profile_id=profile_id).order_by(
-        ProgressAssessment.assessment_date.desc()
-    ).all()
+    # Seek past the cursor when one is given, otherwise fall back to page offsets
+    if before and before_id is not None:
+        try:
+            before_date = datetime.fromisoformat(before)
+        except ValueError:
+            return jsonify({'message': 'Invalid cursor'}), 400
+        # Timestamps are stored as naive UTC, so compare against the same
+        if before_date.tzinfo is not None:
+            before_date = before_date.astimezone(timezone.utc).replace(tzinfo=None)
+        query = query.where(
+            tuple_(ProgressAssessment.assessment_date, ProgressAssessment.id) < (before_date, before_id)
+        )
+    else:
+        query = query.offset((page - 1) * per_page)
+    
+    # Get assessments as plain rows
+    assessments = [dict(row) for row in db.session.execute(query.limit(per_page)).mappings()]
+    
+    next_cursor = None
+    if len(assessments) == per_page:
+        last = assessments[-1]
+        # Left as a datetime so it is serialized like the assessment_date values in the payload
+        next_cursor = {'before': last['assessment_date'], 'before_id': last['id']}
     
     return jsonify({
-        'assessments': [assessment.to_dict() for assessment in assessments]
+        'assessments': assessments,
+        'page': page,
+        'per_page': per_page,
+        'next_cursor': next_cursor
     }), 200
 
 @api_bp.route('/assessments', methods=['POST'])
-@login_required
+@auth_required
 def create_assessment():
     data = request.get_json()
     
@@ -559,9 +643,7 @@ def create_assessment():
         return jsonify({'message': 'Missing required fields'}), 400
     
     # Verify profile belongs to user
-    profile = ChildProfile.query.get_or_404(data['child_profile_id'])
-    if profile.user_id != current_user.id:
-        return jsonify({'message': 'Unauthorized'}), 403
+    profile = get_owned_profile(data['child_profile_id'])
     
     # Create assessment
     new_assessment = ProgressAssessment(
@@ -639,16 +721,52 @@ def generate_learning_path(profile):
         }
     ]
     
-    for activity_data in activities:
-        activity = PathActivity(
-            learning_path_id=path.id,
-            title=activity_data['title'],
-            description=activity_data['description'],
-            activity_type=activity_data['activity_type'],
-            stage_number=activity_data['stage_number']
-        )
-        db.session.add(activity)
+    # Insert all activities with a single bulk statement
+    LearningPath.create_activities(path.id, activities)
     
     db.session.commit()
     
-    return path
\ No newline at end of file
+    return path
+
+# Helper function to fetch a child profile owned by the current user, or 404
+def get_owned_profile(profile_id):
+    return ChildProfile.query.filter_by(id=profile_id, user_id=g.user_id).first_or_404()
+
+# Helper function to load the featured books, cached since ratings change slowly
+@cache.cached(timeout=300, key_prefix='featured_books')
+def load_featured_books():
+    # Get featured books (top rated or curated)
+    featured_books = Book.query.options(undefer(Book.description), raiseload('*')).order_by(Book.rating.desc()).limit(4).all()
+    
+    return [book.to_dict() for book in featured_books]
+
+# Helper function to load the current active challenge shared by all users
+@cache.cached(timeout=30, key_prefix='active_challenge', cache_none=True)
+def load_active_challenge():
+    # For demonstration, use the first active challenge
+    active_challenge = Challenge.query.options(
+        undefer(Challenge.participants_count), raiseload('*')
+    ).filter_by(is_active=True).order_by(Challenge.end_date).first()
+    
+    return active_challenge.to_dict() if active_challenge else None
+
+# Helper function to check interests before they are stored '|'-delimited
+def interests_are_valid(interests):
+    if not isinstance(interests, list):
+        return True
+    return all(isinstance(interest, str) and '|' not in interest for interest in interests)
+
+# Helper function to read bounded pagination parameters from the query string
+def get_pagination_args(default_per_page=20, max_per_page=100):
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = request.args.get('per_page', default_per_page, type=int)
+    per_page = min(max(per_page, 1), max_per_page)
+    
+    return page, per_page
+
+# Helper function to check a keyset cursor is absent or complete; half of one (or a value
+# that failed to parse) would otherwise fall back to offset pages without telling the client
+def cursor_is_complete(value, cursor_id, value_arg, id_arg):
+    if value_arg not in request.args and id_arg not in request.args:
+        return True
+    return value not in (None, '') and cursor_id is not None
\ No newline at end of file
@@ -1,27 +1,77 @@
 import os
+import click
+import orjson
 from flask import Flask, send_from_directory, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-from api import api_bp
+from api import api_bp, cache
 from auth import auth_bp
 from models import db, User, ChildProfile, Book, ReadingList, Challenge, Resource
 from flask_migrate import Migrate
 from flask_login import LoginManager
+from sqlalchemy.pool import StaticPool
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Serialize JSON responses with orjson, which is much faster than the stdlib encoder
+class ORJSONProvider(JSONProvider):
+    options = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.options).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    # Hand orjson's bytes straight to the response instead of decoding to str and re-encoding
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.options), mimetype='application/json')
+
 app = Flask(__name__, static_folder='client/dist', static_url_path='/')
+app.json = ORJSONProvider(app)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev_key_for_development')
 app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///wereadwithkids.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# Configure the connection pool; the pool is per process, so size it to at least the
+# number of threads per worker
+database_uri = app.config['SQLALCHEMY_DATABASE_URI']
+if database_uri in ('sqlite://', 'sqlite:///:memory:'):
+    # An in-memory database only exists on its one connection, so share it
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'connect_args': {'check_same_thread': False},
+        'poolclass': StaticPool
+    }
+elif database_uri.startswith('sqlite'):
+    # File databases keep the default pool so each thread gets its own connection
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'connect_args': {'check_same_thread': False}
+    }
+else:
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 20)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+        'pool_pre_ping': True,
+        'pool_recycle': 1800
+    }
+
 # Enable CORS
 CORS(app)
 
 # Initialize extensions
 db.init_app(app)
-migrate = Migrate(app, db)
+migrate = Migrate(app, db, render_as_batch=True)
+# SimpleCache lives in each worker process, so invalidation only reaches the worker that
+# handled the write and other workers serve stale entries until they expire. Production with
+# several gunicorn workers should set CACHE_TYPE=RedisCache and CACHE_REDIS_URL (needs `redis`).
+cache.init_app(app, config={
+    'CACHE_TYPE': os.environ.get('CACHE_TYPE', 'SimpleCache'),
+    'CACHE_REDIS_URL': os.environ.get('CACHE_REDIS_URL', 'redis://localhost:6379/0'),
+    'CACHE_DEFAULT_TIMEOUT': int(os.environ.get('CACHE_DEFAULT_TIMEOUT', 60))
+})
 
 # Setup login manager
 login_manager = LoginManager()
@@ -36,19 +86,35 @@ def load_user(user_id):
 app.register_blueprint(api_bp, url_prefix='/api')
 app.register_blueprint(auth_bp, url_prefix='/api/auth')
 
-# Serve static files in production
+# Serve static files in production (a front proxy such as nginx should serve
+# client/dist directly with `try_files $uri /index.html` where available)
+def collect_static_files(folder):
+    files = set()
+    for root, _, names in os.walk(folder):
+        for name in names:
+            files.add(os.path.relpath(os.path.join(root, name), folder).replace(os.sep, '/'))
+    return files
+
+static_files = collect_static_files(app.static_folder)
+
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
 def serve(path):
-    if path != "" and os.path.exists(app.static_folder + '/' + path):
+    if path in static_files:
+        # Vite emits content-hashed file names under assets/, so they never change
+        if path.startswith('assets/'):
+            response = send_from_directory(app.static_folder, path, max_age=31536000)
+            response.cache_control.immutable = True
+            return response
         return send_from_directory(app.static_folder, path)
     else:
         return send_from_directory(app.static_folder, 'index.html')
 
-# Initialize database tables
-@app.before_first_request
-def create_tables():
+# Initialize database tables on demand for development; deployments run `flask db upgrade`
+@app.cli.command('init-db')
+def init_db():
     db.create_all()
+    click.echo('Database tables created')
 
 # Error handlers
 @app.errorhandler(404)
@@ -59,6 +125,7 @@ def not_found(e):
 def server_error(e):
     return jsonify({"message": "Internal server error"}), 500
 
+# Development server only; production runs under gunicorn (see gunicorn.conf.py)
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=port, debug=os.environ.get('FLASK_ENV') == 'development')
\ No newline at end of file
@@ -1,6 +1,7 @@
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify, current_app, g
 from flask_login import login_user, logout_user, login_required, current_user
-from models import db, User
+from models import db, User, UserRole, enum_values
+from functools import wraps
 import jwt
 from datetime import datetime, timedelta
 import os
@@ -17,6 +18,9 @@ def register():
         if field not in data:
             return jsonify({'message': f'Missing required field: {field}'}), 400
     
+    if data['role'] not in enum_values(UserRole):
+        return jsonify({'message': 'Invalid role'}), 400
+    
     # Check if user already exists
     if User.query.filter_by(username=data['username']).first():
         return jsonify({'message': 'Username already exists'}), 400
@@ -69,6 +73,10 @@ def login():
     if not user.is_active:
         return jsonify({'message': 'Account is disabled'}), 403
     
+    # Persist the password hash if it was upgraded during the check
+    if user in db.session.dirty:
+        db.session.commit()
+    
     # Login the user
     login_user(user)
     
@@ -110,18 +118,58 @@ def update_theme():
         'theme': current_user.theme_preference
     }), 200
 
+# Helper function to get the JWT signing key, read from the app config on first use and
+# cached on the app so each app (and each test app) signs with its own SECRET_KEY
+def get_signing_key():
+    signing_key = current_app.extensions.get('jwt_signing_key')
+    if signing_key is None:
+        signing_key = current_app.extensions['jwt_signing_key'] = current_app.config['SECRET_KEY']
+    return signing_key
+
 # Helper function to generate JWT token
 def generate_token(user):
     payload = {
         'user_id': user.id,
         'username': user.username,
+        'role': user.role,
         'exp': datetime.utcnow() + timedelta(days=1)
     }
     
     token = jwt.encode(
         payload,
-        current_app.config.get('SECRET_KEY'),
+        get_signing_key(),
         algorithm='HS256'
     )
     
-    return token
\ No newline at end of file
+    return token
+
+# Helper function to decode a JWT token, returning None if it is invalid or expired
+def decode_token(token):
+    try:
+        return jwt.decode(token, get_signing_key(), algorithms=['HS256'])
+    except jwt.InvalidTokenError:
+        return None
+
+# Request hook that stores the identity from a valid bearer token in g
+def load_token_identity():
+    auth_header = request.headers.get('Authorization', '')
+    if auth_header.startswith('Bearer '):
+        payload = decode_token(auth_header[len('Bearer '):])
+        if payload:
+            g.user_id = payload['user_id']
+
+# Helper function to get the current user's id without loading the user row
+# when a bearer token was verified; falls back to the Flask-Login session
+def get_current_user_id():
+    if g.get('user_id') is None and current_user.is_authenticated:
+        g.user_id = current_user.id
+    return g.get('user_id')
+
+# Decorator like login_required that accepts a bearer token or a session
+def auth_required(view):
+    @wraps(view)
+    def decorated(*args, **kwargs):
+        if get_current_user_id() is None:
+            return current_app.login_manager.unauthorized()
+        return view(*args, **kwargs)
+    return decorated
\ No newline at end of file
@@ -0,0 +1,9 @@
+import multiprocessing
+import os
+
+# Production server settings, picked up by `gunicorn app:app` from the project root.
+# Keep the database pool (DB_POOL_SIZE) at least as large as `threads`.
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
@@ -0,0 +1,70 @@
+"""server side timestamp defaults
+
+Revision ID: 189f46ed254a
+Revises: f152d69b161a
+Create Date: 2026-10-15 17:50:44.961027
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '189f46ed254a'
+down_revision = 'f152d69b161a'
+branch_labels = None
+depends_on = None
+
+# Columns that get their timestamp from the database
+timestamp_columns = {
+    'users': ['created_at'],
+    'child_profiles': ['created_at'],
+    'books': ['created_at'],
+    'reading_lists': ['created_at'],
+    'challenges': ['created_at'],
+    'challenge_participants': ['joined_at'],
+    'resources': ['created_at'],
+    'learning_paths': ['created_at', 'last_updated'],
+    'path_activities': ['created_at'],
+    'progress_assessments': ['assessment_date'],
+}
+
+
+def is_sqlite():
+    return op.get_context().dialect.name == 'sqlite'
+
+
+# Same expression models.utcnow compiles to, so defaults match tables made by init-db
+def utcnow():
+    dialect_name = op.get_context().dialect.name
+    if dialect_name == 'postgresql':
+        return sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+    if dialect_name == 'sqlite':
+        return sa.text("(STRFTIME('%Y-%m-%d %H:%M:%f000', 'now'))")
+    return sa.text('CURRENT_TIMESTAMP')
+
+
+def set_server_defaults(server_default):
+    # SQLite rebuilds the table to change a default, and the copy loses the DESC
+    # ordering of the expression index, so take it down around the rebuild
+    if is_sqlite():
+        op.drop_index('ix_progress_assessments_child_date', table_name='progress_assessments')
+
+    for table, columns in timestamp_columns.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.alter_column(column,
+                       existing_type=sa.DateTime(),
+                       server_default=server_default,
+                       existing_nullable=True)
+
+    if is_sqlite():
+        op.create_index('ix_progress_assessments_child_date', 'progress_assessments', ['child_profile_id', sa.text('assessment_date DESC'), 'id'], unique=False)
+
+
+def upgrade():
+    set_server_defaults(utcnow())
+
+
+def downgrade():
+    set_server_defaults(None)
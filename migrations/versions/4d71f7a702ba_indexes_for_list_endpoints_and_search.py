@@ -0,0 +1,61 @@
+"""indexes for list endpoints and search
+
+Revision ID: 4d71f7a702ba
+Revises: 09115f9b1a67
+Create Date: 2026-10-15 17:46:02.118734
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4d71f7a702ba'
+down_revision = '09115f9b1a67'
+branch_labels = None
+depends_on = None
+
+trigram_columns = ['title', 'author', 'description']
+
+
+def is_postgresql():
+    return op.get_context().dialect.name == 'postgresql'
+
+
+def upgrade():
+    # Keep the oldest entry of any duplicated book so the unique constraint can be added
+    op.execute(
+        'DELETE FROM reading_lists WHERE id NOT IN '
+        '(SELECT MIN(id) FROM reading_lists GROUP BY child_profile_id, book_id)'
+    )
+
+    with op.batch_alter_table('reading_lists', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_reading_lists_child_book', ['child_profile_id', 'book_id'])
+
+    op.create_index('ix_books_age_genre', 'books', ['age_range', 'genre'], unique=False)
+    op.create_index('ix_books_interactive_rating', 'books', ['rating'], unique=False, postgresql_where=sa.text('is_interactive'), sqlite_where=sa.text('is_interactive = 1'))
+    op.create_index('ix_child_profiles_user', 'child_profiles', ['user_id'], unique=False)
+    op.create_index('ix_learning_paths_child', 'learning_paths', ['child_profile_id'], unique=False)
+    op.create_index('ix_path_activities_path_completed', 'path_activities', ['learning_path_id', 'is_completed'], unique=False)
+    op.create_index('ix_progress_assessments_child_date', 'progress_assessments', ['child_profile_id', sa.text('assessment_date DESC'), 'id'], unique=False)
+
+    if is_postgresql():
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for column in trigram_columns:
+            op.create_index(f'ix_books_{column}_trgm', 'books', [column], unique=False, postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'})
+
+
+def downgrade():
+    if is_postgresql():
+        for column in trigram_columns:
+            op.drop_index(f'ix_books_{column}_trgm', table_name='books')
+
+    op.drop_index('ix_progress_assessments_child_date', table_name='progress_assessments')
+    op.drop_index('ix_path_activities_path_completed', table_name='path_activities')
+    op.drop_index('ix_learning_paths_child', table_name='learning_paths')
+    op.drop_index('ix_child_profiles_user', table_name='child_profiles')
+    op.drop_index('ix_books_interactive_rating', table_name='books')
+    op.drop_index('ix_books_age_genre', table_name='books')
+
+    with op.batch_alter_table('reading_lists', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_reading_lists_child_book', type_='unique')
@@ -0,0 +1,53 @@
+"""denormalized tag and interest columns
+
+Revision ID: 5c1c260e0ae3
+Revises: 189f46ed254a
+Create Date: 2026-10-15 17:53:18.204577
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1c260e0ae3'
+down_revision = '189f46ed254a'
+branch_labels = None
+depends_on = None
+
+
+# Subquery joining a parent's values in the order they were added, which is the order the
+# application appends them in; junction rows are never updated, so ctid keeps that order too
+def delimited_list(column, table, key, parent):
+    if op.get_context().dialect.name == 'postgresql':
+        return (f"SELECT string_agg({column}, '|' ORDER BY ctid) FROM {table} "
+                f"WHERE {table}.{key} = {parent}.id")
+    # group_concat takes no ORDER BY before SQLite 3.44, so aggregate an ordered subquery
+    return (f"SELECT group_concat({column}, '|') FROM (SELECT {column} FROM {table} "
+            f"WHERE {table}.{key} = {parent}.id ORDER BY rowid)")
+
+
+def upgrade():
+    with op.batch_alter_table('books', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('tags_csv', sa.Text(), nullable=True))
+
+    with op.batch_alter_table('child_profiles', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('interests_csv', sa.Text(), nullable=True))
+
+    # Backfill the delimited lists from the association tables
+    op.execute(
+        "UPDATE books SET tags_csv = COALESCE(("
+        f"{delimited_list('tag', 'book_tags', 'book_id', 'books')}), '')"
+    )
+    op.execute(
+        "UPDATE child_profiles SET interests_csv = COALESCE(("
+        f"{delimited_list('interest', 'child_interests', 'child_profile_id', 'child_profiles')}), '')"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('child_profiles', schema=None) as batch_op:
+        batch_op.drop_column('interests_csv')
+
+    with op.batch_alter_table('books', schema=None) as batch_op:
+        batch_op.drop_column('tags_csv')
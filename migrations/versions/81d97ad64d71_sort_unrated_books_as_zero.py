@@ -0,0 +1,27 @@
+"""sort unrated books as zero
+
+Revision ID: 81d97ad64d71
+Revises: d59a6810f180
+Create Date: 2026-10-15 18:04:26.517093
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '81d97ad64d71'
+down_revision = 'd59a6810f180'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The interactive listing now orders by coalesce(rating, 0), id
+    op.drop_index('ix_books_interactive_rating', table_name='books')
+    op.create_index('ix_books_interactive_rating', 'books', [sa.text('coalesce(rating, 0)'), 'id'], unique=False, postgresql_where=sa.text('is_interactive'), sqlite_where=sa.text('is_interactive = 1'))
+
+
+def downgrade():
+    op.drop_index('ix_books_interactive_rating', table_name='books')
+    op.create_index('ix_books_interactive_rating', 'books', ['rating'], unique=False, postgresql_where=sa.text('is_interactive'), sqlite_where=sa.text('is_interactive = 1'))
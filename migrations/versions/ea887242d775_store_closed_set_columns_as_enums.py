@@ -0,0 +1,118 @@
+"""store closed-set columns as enums
+
+Revision ID: ea887242d775
+Revises: 5c1c260e0ae3
+Create Date: 2026-10-15 17:55:07.583921
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ea887242d775'
+down_revision = '5c1c260e0ae3'
+branch_labels = None
+depends_on = None
+
+user_role = sa.Enum('parent', 'educator', 'admin', name='user_role')
+reading_status = sa.Enum('to-read', 'in-progress', 'completed', name='reading_status')
+challenge_unit = sa.Enum('books', 'minutes', name='challenge_unit')
+activity_type = sa.Enum('reading', 'quiz', 'game', 'exercise', 'assessment', 'creative', name='activity_type')
+activity_status = sa.Enum('pending', 'in-progress', 'completed', name='activity_status')
+enum_types = [user_role, reading_status, challenge_unit, activity_type, activity_status]
+
+
+def is_postgresql():
+    return op.get_context().dialect.name == 'postgresql'
+
+
+def coerce_to_enum(table, column, enum, fallback):
+    values = ', '.join(f"'{value}'" for value in enum.enums)
+    op.execute(f"UPDATE {table} SET {column} = '{fallback}' WHERE {column} NOT IN ({values})")
+
+
+def upgrade():
+    if is_postgresql():
+        for enum in enum_types:
+            enum.create(op.get_bind())
+
+    # Free-form values were accepted before the enum columns and would abort the cast; fall
+    # back to the column defaults, or to the first value where a column has no default
+    coerce_to_enum('users', 'role', user_role, 'parent')
+    coerce_to_enum('reading_lists', 'status', reading_status, 'to-read')
+    coerce_to_enum('challenges', 'unit', challenge_unit, 'books')
+    coerce_to_enum('path_activities', 'activity_type', activity_type, 'reading')
+    coerce_to_enum('path_activities', 'status', activity_status, 'pending')
+
+    with op.batch_alter_table('challenges', schema=None) as batch_op:
+        batch_op.alter_column('unit',
+               existing_type=sa.VARCHAR(length=20),
+               type_=challenge_unit,
+               existing_nullable=False,
+               postgresql_using='unit::challenge_unit')
+
+    with op.batch_alter_table('path_activities', schema=None) as batch_op:
+        batch_op.alter_column('activity_type',
+               existing_type=sa.VARCHAR(length=50),
+               type_=activity_type,
+               existing_nullable=False,
+               postgresql_using='activity_type::activity_type')
+        batch_op.alter_column('status',
+               existing_type=sa.VARCHAR(length=20),
+               type_=activity_status,
+               existing_nullable=True,
+               postgresql_using='status::activity_status')
+
+    with op.batch_alter_table('reading_lists', schema=None) as batch_op:
+        batch_op.alter_column('status',
+               existing_type=sa.VARCHAR(length=20),
+               type_=reading_status,
+               existing_nullable=True,
+               postgresql_using='status::reading_status')
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.alter_column('role',
+               existing_type=sa.VARCHAR(length=20),
+               type_=user_role,
+               existing_nullable=True,
+               postgresql_using='role::user_role')
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.alter_column('role',
+               existing_type=user_role,
+               type_=sa.VARCHAR(length=20),
+               existing_nullable=True,
+               postgresql_using='role::text')
+
+    with op.batch_alter_table('reading_lists', schema=None) as batch_op:
+        batch_op.alter_column('status',
+               existing_type=reading_status,
+               type_=sa.VARCHAR(length=20),
+               existing_nullable=True,
+               postgresql_using='status::text')
+
+    with op.batch_alter_table('path_activities', schema=None) as batch_op:
+        batch_op.alter_column('status',
+               existing_type=activity_status,
+               type_=sa.VARCHAR(length=20),
+               existing_nullable=True,
+               postgresql_using='status::text')
+        batch_op.alter_column('activity_type',
+               existing_type=activity_type,
+               type_=sa.VARCHAR(length=50),
+               existing_nullable=False,
+               postgresql_using='activity_type::text')
+
+    with op.batch_alter_table('challenges', schema=None) as batch_op:
+        batch_op.alter_column('unit',
+               existing_type=challenge_unit,
+               type_=sa.VARCHAR(length=20),
+               existing_nullable=False,
+               postgresql_using='unit::text')
+
+    if is_postgresql():
+        for enum in reversed(enum_types):
+            enum.drop(op.get_bind())
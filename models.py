@@ -1,10 +1,87 @@
+import enum
+from functools import lru_cache
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
+from sqlalchemy import event, DDL, case, func, update, select, tuple_, lambda_stmt, literal_column
+from sqlalchemy.orm import joinedload, raiseload
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.associationproxy import association_proxy
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
 
+# Engine and pool options (pool_size, max_overflow, pool_pre_ping, pool_recycle) are set
+# through SQLALCHEMY_ENGINE_OPTIONS in app.py; size the pool to at least the number of
+# threads per worker (DB_POOL_SIZE / DB_MAX_OVERFLOW override the defaults)
 db = SQLAlchemy()
 
+# Argon2id hasher for user passwords
+password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=2)
+
+# Helper function to check whether a stored hash uses outdated parameters; the PHC string
+# is parsed in Python, so the answer is cached per hash (each hash is unique per user)
+@lru_cache(maxsize=4096)
+def hash_needs_rehash(password_hash):
+    return password_hasher.check_needs_rehash(password_hash)
+
+# Server-side UTC timestamp used as the column default, so the database assigns
+# creation times instead of a Python call per inserted row
+class utcnow(FunctionElement):
+    type = db.DateTime()
+    inherit_cache = True
+
+@compiles(utcnow, 'postgresql')
+def pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+# SQLite stores DateTime as text; match SQLAlchemy's microsecond format so
+# server-assigned values compare correctly against bound datetimes
+@compiles(utcnow, 'sqlite')
+def sqlite_utcnow(element, compiler, **kw):
+    return "(STRFTIME('%Y-%m-%d %H:%M:%f000', 'now'))"
+
+@compiles(utcnow)
+def default_utcnow(element, compiler, **kw):
+    return 'CURRENT_TIMESTAMP'
+
+# Closed sets of values stored as enums rather than free-form strings
+class UserRole(enum.StrEnum):
+    PARENT = 'parent'
+    EDUCATOR = 'educator'
+    ADMIN = 'admin'
+
+class ReadingStatus(enum.StrEnum):
+    TO_READ = 'to-read'
+    IN_PROGRESS = 'in-progress'
+    COMPLETED = 'completed'
+
+class ChallengeUnit(enum.StrEnum):
+    BOOKS = 'books'
+    MINUTES = 'minutes'
+
+class ActivityType(enum.StrEnum):
+    READING = 'reading'
+    QUIZ = 'quiz'
+    GAME = 'game'
+    EXERCISE = 'exercise'
+    ASSESSMENT = 'assessment'
+    CREATIVE = 'creative'
+
+class ActivityStatus(enum.StrEnum):
+    PENDING = 'pending'
+    IN_PROGRESS = 'in-progress'
+    COMPLETED = 'completed'
+
+# Helper function to list the stored values of an enum
+def enum_values(enum_class):
+    return [member.value for member in enum_class]
+
+# Helper function to build a column type that stores enum values (a native ENUM on Postgres)
+def enum_type(enum_class, name):
+    return db.Enum(enum_class, name=name, values_callable=enum_values)
+
 # Association tables for many-to-many relationships
 book_tags = db.Table('book_tags',
     db.Column('book_id', db.Integer, db.ForeignKey('books.id'), primary_key=True),
@@ -21,9 +98,62 @@ challenge_participants = db.Table('challenge_participants',
     db.Column('child_profile_id', db.Integer, db.ForeignKey('child_profiles.id'), primary_key=True),
     db.Column('progress', db.Integer, default=0),
     db.Column('completed', db.Boolean, default=False),
-    db.Column('joined_at', db.DateTime, default=datetime.utcnow)
+    db.Column('joined_at', db.DateTime, server_default=utcnow())
 )
 
+# Helper function to build a multi-row INSERT that skips rows already present
+def insert_ignoring_duplicates(table, rows):
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        return postgresql.insert(table).values(rows).on_conflict_do_nothing()
+    if dialect == 'sqlite':
+        return sqlite.insert(table).values(rows).on_conflict_do_nothing()
+    return table.insert().values(rows)
+
+# Helper function to build an INSERT that supports ON CONFLICT ... DO UPDATE; returns None
+# on databases without it so callers can fall back to per-row updates
+def upsert_insert(table):
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        return postgresql.insert(table)
+    if dialect == 'sqlite':
+        return sqlite.insert(table)
+    return None
+
+# Helper function to split a '|'-delimited tag or interest string into a list
+def split_csv_values(csv):
+    return csv.split('|') if csv else []
+
+# Helper function to add a value to a '|'-delimited string, skipping duplicates
+def add_csv_value(csv, value):
+    check_csv_values([value])
+    values = split_csv_values(csv)
+    if value not in values:
+        values.append(value)
+    return '|'.join(values)
+
+# Helper function to remove a value from a '|'-delimited string
+def remove_csv_value(csv, value):
+    return '|'.join(v for v in split_csv_values(csv) if v != value)
+
+# Helper function to reject values containing the '|' delimiter, which would split them apart
+def check_csv_values(values):
+    for value in values:
+        if '|' in value:
+            raise ValueError(f"'|' is not allowed in tags or interests: {value!r}")
+
+# Helper function to build a SQL expression appending values to a '|'-delimited column
+def append_csv_values(column, values):
+    added = '|'.join(values)
+    return case((func.coalesce(column, '') == '', added), else_=column + '|' + added)
+
+# Mapped classes for the tag and interest rows, exposed on their parents as plain strings
+class BookTag(db.Model):
+    __table__ = book_tags
+
+class ChildInterest(db.Model):
+    __table__ = child_interests
+
 # User model
 class User(db.Model, UserMixin):
     __tablename__ = 'users'
@@ -31,11 +161,11 @@ class User(db.Model, UserMixin):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
-    password_hash = db.Column(db.String(128), nullable=False)
+    password_hash = db.Column(db.String(255), nullable=False)
     first_name = db.Column(db.String(50), nullable=False)
     last_name = db.Column(db.String(50), nullable=False)
-    role = db.Column(db.String(20), default='parent')  # 'parent', 'educator', 'admin'
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    role = db.Column(enum_type(UserRole, 'user_role'), default=UserRole.PARENT)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
     is_active = db.Column(db.Boolean, default=True)
     theme_preference = db.Column(db.String(10), default='light')  # 'light' or 'dark'
     
@@ -43,10 +173,24 @@ class User(db.Model, UserMixin):
     child_profiles = db.relationship('ChildProfile', backref='user', lazy=True)
     
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
         
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        # Hashes from before the argon2 switch are Werkzeug strings; upgrade them on success
+        if not self.password_hash.startswith('$argon2'):
+            if not check_password_hash(self.password_hash, password):
+                return False
+            self.set_password(password)
+            return True
+        
+        try:
+            password_hasher.verify(self.password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+        
+        if hash_needs_rehash(self.password_hash):
+            self.set_password(password)
+        return True
     
     def to_dict(self):
         return {
@@ -56,7 +200,7 @@ class User(db.Model, UserMixin):
             'first_name': self.first_name,
             'last_name': self.last_name,
             'role': self.role,
-            'created_at': self.created_at.isoformat(),
+            'created_at': self.created_at,
             'theme_preference': self.theme_preference
         }
 
@@ -64,22 +208,42 @@ class User(db.Model, UserMixin):
 class ChildProfile(db.Model):
     __tablename__ = 'child_profiles'
     
+    __table_args__ = (
+        db.Index('ix_child_profiles_user', 'user_id'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     name = db.Column(db.String(100), nullable=False)
     age = db.Column(db.Integer, nullable=False)
     reading_level = db.Column(db.String(20), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
     avatar_url = db.Column(db.String(255))
+    # Denormalized copy of the interests for reads; child_interests stays the source for lookups
+    interests_csv = db.Column(db.Text, default='')
     
-    # Many-to-many relationship for interests
-    interests = db.relationship('child_interests', secondary=child_interests, lazy='subquery',
-                                backref=db.backref('child_profiles', lazy=True))
+    # Interests stored in child_interests, exposed as a list of strings
+    _interests = db.relationship('ChildInterest', lazy=True, cascade='all, delete-orphan')
+    interests = association_proxy('_interests', 'interest',
+                                  creator=lambda interest: ChildInterest(interest=interest))
     
     # Relationships
     reading_lists = db.relationship('ReadingList', backref='child_profile', lazy=True)
     learning_paths = db.relationship('LearningPath', backref='child_profile', lazy=True)
     
+    @classmethod
+    def bulk_add_interests(cls, child_profile_id, interests):
+        check_csv_values(interests)
+        rows = [{'child_profile_id': child_profile_id, 'interest': interest} for interest in interests]
+        if rows:
+            added = db.session.execute(
+                insert_ignoring_duplicates(child_interests, rows).returning(child_interests.c.interest)
+            ).scalars().all()
+            if added:
+                db.session.execute(update(cls).where(cls.id == child_profile_id).values(
+                    interests_csv=append_csv_values(cls.interests_csv, added)
+                ))
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -87,8 +251,8 @@ class ChildProfile(db.Model):
             'name': self.name,
             'age': self.age,
             'reading_level': self.reading_level,
-            'interests': [interest for interest in self.interests],
-            'created_at': self.created_at.isoformat(),
+            'interests': split_csv_values(self.interests_csv),
+            'created_at': self.created_at,
             'avatar_url': self.avatar_url
         }
 
@@ -96,10 +260,26 @@ class ChildProfile(db.Model):
 class Book(db.Model):
     __tablename__ = 'books'
     
+    __table_args__ = (
+        db.Index('ix_books_age_genre', 'age_range', 'genre'),
+        # Partial index for the interactive-only listing, on the same sort key as get_books
+        db.Index('ix_books_interactive_rating', db.text('coalesce(rating, 0)'), 'id',
+                 postgresql_where=db.text('is_interactive'),
+                 sqlite_where=db.text('is_interactive = 1')),
+        # Trigram indexes let Postgres serve the ILIKE '%query%' book search from an index;
+        # they need the pg_trgm extension and are skipped on other databases
+        db.Index('ix_books_title_trgm', 'title', postgresql_using='gin',
+                 postgresql_ops={'title': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+        db.Index('ix_books_author_trgm', 'author', postgresql_using='gin',
+                 postgresql_ops={'author': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+        db.Index('ix_books_description_trgm', 'description', postgresql_using='gin',
+                 postgresql_ops={'description': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     author = db.Column(db.String(100), nullable=False)
-    description = db.Column(db.Text, nullable=False)
+    description = db.deferred(db.Column(db.Text, nullable=False))
     age_range = db.Column(db.String(20), nullable=False)
     genre = db.Column(db.String(50), nullable=False)
     cover_image_url = db.Column(db.String(255))
@@ -108,15 +288,64 @@ class Book(db.Model):
     reading_time_minutes = db.Column(db.Integer)
     rating = db.Column(db.Float, default=0.0)
     reviews_count = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
+    # Denormalized copy of the tags for reads; book_tags stays the source for tag lookups
+    tags_csv = db.Column(db.Text, default='')
     
-    # Many-to-many relationship for tags
-    tags = db.relationship('book_tags', secondary=book_tags, lazy='subquery',
-                           backref=db.backref('books', lazy=True))
+    # Tags stored in book_tags, exposed as a list of strings
+    _tags = db.relationship('BookTag', lazy=True, cascade='all, delete-orphan')
+    tags = association_proxy('_tags', 'tag', creator=lambda tag: BookTag(tag=tag))
     
     # Relationships
     reading_lists = db.relationship('ReadingList', backref='book', lazy=True)
     
+    @classmethod
+    def bulk_add_tags(cls, book_id, tags):
+        check_csv_values(tags)
+        rows = [{'book_id': book_id, 'tag': tag} for tag in tags]
+        if rows:
+            added = db.session.execute(
+                insert_ignoring_duplicates(book_tags, rows).returning(book_tags.c.tag)
+            ).scalars().all()
+            if added:
+                db.session.execute(update(cls).where(cls.id == book_id).values(
+                    tags_csv=append_csv_values(cls.tags_csv, added)
+                ))
+    
+    # Statement for the book listing, built from lambdas so the compiled SQL is cached
+    # per filter combination and only the parameters change between requests
+    @classmethod
+    def list_stmt(cls, age_range=None, genre=None, interactive_only=False, search_query=None,
+                  before_rating=None, before_id=None, limit=20, offset=0):
+        # Unrated books sort as 0 so NULL ratings have a fixed place and never reach the cursor;
+        # the 0 is inlined so the ORDER BY matches the index expression
+        stmt = lambda_stmt(lambda: select(
+            Book.id, Book.title, Book.author, Book.age_range, Book.genre, Book.cover_image_url,
+            Book.is_interactive, Book.reading_time_minutes, Book.rating, Book.reviews_count,
+            Book.tags_csv
+        ).order_by(func.coalesce(Book.rating, literal_column('0')).desc(), Book.id.desc()).limit(limit))
+        
+        if age_range:
+            stmt += lambda s: s.where(Book.age_range == age_range)
+        if genre:
+            stmt += lambda s: s.where(Book.genre == genre)
+        if interactive_only:
+            stmt += lambda s: s.where(Book.is_interactive == True)
+        if search_query:
+            pattern = f'%{search_query}%'
+            stmt += lambda s: s.where(Book.title.ilike(pattern) |
+                                      Book.author.ilike(pattern) |
+                                      Book.description.ilike(pattern))
+        
+        # Seek past the cursor when one is given, otherwise fall back to page offsets
+        if before_rating is not None and before_id is not None:
+            stmt += lambda s: s.where(tuple_(func.coalesce(Book.rating, literal_column('0')), Book.id) <
+                                      tuple_(before_rating, before_id))
+        else:
+            stmt += lambda s: s.offset(offset)
+        
+        return stmt
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -125,28 +354,103 @@ class Book(db.Model):
             'description': self.description,
             'age_range': self.age_range,
             'genre': self.genre,
-            'tags': [tag for tag in self.tags],
+            'tags': split_csv_values(self.tags_csv),
             'cover_image_url': self.cover_image_url,
             'content_url': self.content_url,
             'is_interactive': self.is_interactive,
             'reading_time_minutes': self.reading_time_minutes,
             'rating': self.rating,
             'reviews_count': self.reviews_count,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at
         }
 
+# Keep the denormalized tag and interest strings in step with their collections
+@event.listens_for(Book._tags, 'append')
+def add_book_tag(book, book_tag, initiator):
+    book.tags_csv = add_csv_value(book.tags_csv, book_tag.tag)
+
+@event.listens_for(Book._tags, 'remove')
+def remove_book_tag(book, book_tag, initiator):
+    book.tags_csv = remove_csv_value(book.tags_csv, book_tag.tag)
+
+@event.listens_for(ChildProfile._interests, 'append')
+def add_child_interest(profile, child_interest, initiator):
+    profile.interests_csv = add_csv_value(profile.interests_csv, child_interest.interest)
+
+@event.listens_for(ChildProfile._interests, 'remove')
+def remove_child_interest(profile, child_interest, initiator):
+    profile.interests_csv = remove_csv_value(profile.interests_csv, child_interest.interest)
+
+# The trigram indexes on books need pg_trgm; migrations create it too
+event.listen(Book.__table__, 'before_create',
+             DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql'))
+
 # Reading List model
 class ReadingList(db.Model):
     __tablename__ = 'reading_lists'
     
+    __table_args__ = (
+        db.UniqueConstraint('child_profile_id', 'book_id', name='uq_reading_lists_child_book'),
+        db.Index('ix_reading_lists_child_status', 'child_profile_id', 'status'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     child_profile_id = db.Column(db.Integer, db.ForeignKey('child_profiles.id'), nullable=False)
-    book_id = db.Column(db.Integer, db.ForeignKey('books.id'), nullable=False)
-    status = db.Column(db.String(20), default='to-read')  # 'to-read', 'in-progress', 'completed'
+    book_id = db.Column(db.Integer, db.ForeignKey('books.id'), nullable=False, index=True)
+    status = db.Column(enum_type(ReadingStatus, 'reading_status'), default=ReadingStatus.TO_READ)
     progress_percentage = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
     completed_at = db.Column(db.DateTime)
     
+    # Insert or update reading progress for many books in one statement, keyed on
+    # uq_reading_lists_child_book; returns the resulting rows
+    @classmethod
+    def upsert_progress(cls, child_profile_id, rows):
+        rows = [dict(row, child_profile_id=child_profile_id) for row in rows]
+        if not rows:
+            return []
+        stmt = upsert_insert(cls.__table__)
+        if stmt is None:
+            return cls.update_progress_per_row(child_profile_id, rows)
+        stmt = stmt.values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['child_profile_id', 'book_id'],
+            set_={
+                'progress_percentage': stmt.excluded.progress_percentage,
+                'status': stmt.excluded.status,
+                'completed_at': func.coalesce(cls.__table__.c.completed_at, stmt.excluded.completed_at)
+            }
+        ).returning(*cls.__table__.c)
+        return db.session.execute(stmt).mappings().all()
+    
+    # Fallback for databases without ON CONFLICT: load the existing items for these books,
+    # then update them or add new ones
+    @classmethod
+    def update_progress_per_row(cls, child_profile_id, rows):
+        items = {item.book_id: item for item in cls.query.filter(
+            cls.child_profile_id == child_profile_id,
+            cls.book_id.in_([row['book_id'] for row in rows])
+        )}
+        for row in rows:
+            item = items.get(row['book_id'])
+            if item is None:
+                item = items[row['book_id']] = cls(**row)
+                db.session.add(item)
+            else:
+                item.progress_percentage = row['progress_percentage']
+                item.status = row['status']
+                item.completed_at = item.completed_at or row['completed_at']
+        db.session.flush()
+        return [items[row['book_id']].to_dict() for row in rows]
+    
+    # Cached statement for a child's reading list with each item's book joined in
+    @classmethod
+    def list_for_child_stmt(cls, child_profile_id):
+        return lambda_stmt(lambda: select(ReadingList).options(
+            joinedload(ReadingList.book, innerjoin=True).undefer(Book.description),
+            raiseload('*')
+        ).where(ReadingList.child_profile_id == child_profile_id))
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -154,29 +458,52 @@ class ReadingList(db.Model):
             'book_id': self.book_id,
             'status': self.status,
             'progress_percentage': self.progress_percentage,
-            'created_at': self.created_at.isoformat(),
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None
+            'created_at': self.created_at,
+            'completed_at': self.completed_at
         }
 
 # Challenge model
 class Challenge(db.Model):
     __tablename__ = 'challenges'
     
+    __table_args__ = (
+        # Partial index covering only active challenges, ordered like load_active_challenge
+        db.Index('ix_challenges_active_end_date', 'end_date',
+                 postgresql_where=db.text('is_active'),
+                 sqlite_where=db.text('is_active = 1')),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=False)
     goal = db.Column(db.Integer, nullable=False)  # Number of books or minutes to read
-    unit = db.Column(db.String(20), nullable=False)  # 'books' or 'minutes'
+    unit = db.Column(enum_type(ChallengeUnit, 'challenge_unit'), nullable=False)
     start_date = db.Column(db.DateTime, nullable=False)
     end_date = db.Column(db.DateTime, nullable=False)
     image_url = db.Column(db.String(255))
     is_active = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
     
     # Participants through association table
-    participants = db.relationship('ChildProfile', secondary=challenge_participants, lazy='subquery',
+    participants = db.relationship('ChildProfile', secondary=challenge_participants, lazy=True,
                                   backref=db.backref('challenges', lazy=True))
     
+    # Participant count computed in SQL; undefer it on list queries to fold it into the main SELECT
+    participants_count = db.column_property(
+        db.select(db.func.count(challenge_participants.c.child_profile_id))
+        .where(challenge_participants.c.challenge_id == id)
+        .correlate_except(challenge_participants)
+        .scalar_subquery(),
+        deferred=True
+    )
+    
+    @classmethod
+    def bulk_add_participants(cls, challenge_id, child_profile_ids):
+        rows = [{'challenge_id': challenge_id, 'child_profile_id': child_profile_id, 'progress': 0, 'completed': False}
+                for child_profile_id in child_profile_ids]
+        if rows:
+            db.session.execute(insert_ignoring_duplicates(challenge_participants, rows))
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -184,12 +511,12 @@ class Challenge(db.Model):
             'description': self.description,
             'goal': self.goal,
             'unit': self.unit,
-            'start_date': self.start_date.isoformat(),
-            'end_date': self.end_date.isoformat(),
+            'start_date': self.start_date,
+            'end_date': self.end_date,
             'image_url': self.image_url,
             'is_active': self.is_active,
-            'created_at': self.created_at.isoformat(),
-            'participants_count': len(self.participants)
+            'created_at': self.created_at,
+            'participants_count': self.participants_count
         }
 
 # Resource model
@@ -198,13 +525,13 @@ class Resource(db.Model):
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
-    description = db.Column(db.Text, nullable=False)
+    description = db.deferred(db.Column(db.Text, nullable=False))
     type = db.Column(db.String(50), nullable=False)  # 'article', 'video', 'printable', etc.
     category = db.Column(db.String(50), nullable=False)  # 'parent_tips', 'classroom_activities', etc.
     age_range = db.Column(db.String(20))
     file_url = db.Column(db.String(255), nullable=False)
     thumbnail_url = db.Column(db.String(255))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
     
     def to_dict(self):
         return {
@@ -216,25 +543,36 @@ class Resource(db.Model):
             'age_range': self.age_range,
             'file_url': self.file_url,
             'thumbnail_url': self.thumbnail_url,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at
         }
 
 # Learning Path model for AI-generated personalized learning journeys
 class LearningPath(db.Model):
     __tablename__ = 'learning_paths'
     
+    __table_args__ = (
+        db.Index('ix_learning_paths_child', 'child_profile_id'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     child_profile_id = db.Column(db.Integer, db.ForeignKey('child_profiles.id'), nullable=False)
     title = db.Column(db.String(200), nullable=False)
-    description = db.Column(db.Text, nullable=False)
+    description = db.deferred(db.Column(db.Text, nullable=False))
     current_stage = db.Column(db.Integer, default=1)
     total_stages = db.Column(db.Integer, nullable=False)
     progress_percentage = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    last_updated = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
+    last_updated = db.Column(db.DateTime, server_default=utcnow())
     
     # Relationships
-    path_activities = db.relationship('PathActivity', backref='learning_path', lazy=True)
+    path_activities = db.relationship('PathActivity', backref='learning_path', lazy=True,
+                                      order_by='PathActivity.stage_number')
+    
+    @classmethod
+    def create_activities(cls, learning_path_id, rows):
+        rows = [dict(row, learning_path_id=learning_path_id) for row in rows]
+        if rows:
+            db.session.execute(PathActivity.__table__.insert(), rows)
     
     def to_dict(self):
         return {
@@ -245,24 +583,29 @@ class LearningPath(db.Model):
             'current_stage': self.current_stage,
             'total_stages': self.total_stages,
             'progress_percentage': self.progress_percentage,
-            'created_at': self.created_at.isoformat(),
-            'last_updated': self.last_updated.isoformat()
+            'created_at': self.created_at,
+            'last_updated': self.last_updated
         }
 
 # Path Activity model for activities in a learning path
 class PathActivity(db.Model):
     __tablename__ = 'path_activities'
     
+    __table_args__ = (
+        db.Index('ix_path_activities_path_completed', 'learning_path_id', 'is_completed'),
+        db.Index('ix_path_activities_path_stage', 'learning_path_id', 'stage_number'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     learning_path_id = db.Column(db.Integer, db.ForeignKey('learning_paths.id'), nullable=False)
     title = db.Column(db.String(200), nullable=False)
-    description = db.Column(db.Text, nullable=False)
-    activity_type = db.Column(db.String(50), nullable=False)  # 'reading', 'quiz', 'game', 'exercise'
+    description = db.deferred(db.Column(db.Text, nullable=False))
+    activity_type = db.Column(enum_type(ActivityType, 'activity_type'), nullable=False)
     content_url = db.Column(db.String(255))
     stage_number = db.Column(db.Integer, nullable=False)
-    status = db.Column(db.String(20), default='pending')  # 'pending', 'in-progress', 'completed'
+    status = db.Column(enum_type(ActivityStatus, 'activity_status'), default=ActivityStatus.PENDING)
     is_completed = db.Column(db.Boolean, default=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
     
     def to_dict(self):
         return {
@@ -275,27 +618,32 @@ class PathActivity(db.Model):
             'stage_number': self.stage_number,
             'status': self.status,
             'is_completed': self.is_completed,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at
         }
 
 # Progress Assessment model for tracking learning progress
 class ProgressAssessment(db.Model):
     __tablename__ = 'progress_assessments'
     
+    __table_args__ = (
+        # Serves the per-child assessment history and its keyset pagination
+        db.Index('ix_progress_assessments_child_date', 'child_profile_id', db.desc('assessment_date'), 'id'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     child_profile_id = db.Column(db.Integer, db.ForeignKey('child_profiles.id'), nullable=False)
-    assessment_date = db.Column(db.DateTime, default=datetime.utcnow)
+    assessment_date = db.Column(db.DateTime, server_default=utcnow())
     reading_level = db.Column(db.String(20), nullable=False)
     reading_fluency_score = db.Column(db.Integer)
     comprehension_score = db.Column(db.Integer)
     vocabulary_score = db.Column(db.Integer)
-    notes = db.Column(db.Text)
+    notes = db.deferred(db.Column(db.Text))
     
     def to_dict(self):
         return {
             'id': self.id,
             'child_profile_id': self.child_profile_id,
-            'assessment_date': self.assessment_date.isoformat(),
+            'assessment_date': self.assessment_date,
             'reading_level': self.reading_level,
             'reading_fluency_score': self.reading_fluency_score,
             'comprehension_score': self.comprehension_score,